@@ -0,0 +1,140 @@
+"""
+Lazy parsing of numpydoc style docstrings.
+
+This module is imported on first use by `docsplice.splice`, so that merely
+importing `docsplice` does not incur the cost of importing `numpydoc`.
+"""
+
+# std
+import copy
+from operator import methodcaller
+
+# third-party
+from numpydoc.docscrape import NumpyDocString
+
+# relative
+from .sections import LISTED_SECTIONS, STRING_SECTIONS
+
+
+# Formatter for each section, taking only the parsed docstring as argument
+FORMATTERS = {
+    'Signature':                NumpyDocString._str_signature,
+    'Summary':                  NumpyDocString._str_summary,
+    'Extended Summary':         NumpyDocString._str_extended_summary,
+    'See Also':                 methodcaller('_str_see_also', ''),
+    'index':                    NumpyDocString._str_index
+}
+FORMATTERS.update((sec, methodcaller('_str_param_list', sec))
+                  for sec in LISTED_SECTIONS)
+FORMATTERS.update((sec, methodcaller('_str_section', sec))
+                  for sec in STRING_SECTIONS)
+
+
+class LazyDocString(NumpyDocString):
+    """
+    A `NumpyDocString` that defers parsing of individual sections until they are
+    first accessed. On construction, only the signature and summary are parsed,
+    while the remaining sections are split off and kept as raw lines. Sections
+    that are never requested are therefore never parsed.
+    """
+
+    def _parse(self):
+        self._raw = raw = {}
+        self._formatted = {}
+        self._items = {}
+
+        self._doc.reset()
+        self._parse_summary()
+
+        for section, content in self._read_sections():
+            if section.startswith('..'):
+                raw['index'] = (section, content)
+                continue
+
+            section = ' '.join(s.capitalize() for s in section.split(' '))
+            if section in raw:
+                self._error_location(f'The section {section} appears twice in '
+                                     + '\n'.join(self._doc._str))
+
+            if section in self._parsed_data:
+                raw[section] = (section, content)
+            else:
+                self._error_location(f'Unknown section {section}', error=False)
+
+        if 'Receives' in raw and 'Yields' not in raw:
+            raise ValueError('Docstring contains a Receives section but not '
+                             'Yields.')
+
+    def _parse_section(self, section, content):
+        if section in {'Parameters', 'Other Parameters', 'Attributes',
+                       'Methods'}:
+            return self._parse_param_list(content)
+
+        if section in {'Returns', 'Yields', 'Raises', 'Warns', 'Receives'}:
+            return self._parse_param_list(content, single_element_is_type=True)
+
+        if section.startswith('.. index::'):
+            return self._parse_index(section, content)
+
+        if section == 'See Also':
+            return self._parse_see_also(content)
+
+        return content
+
+    def __getitem__(self, key):
+        if key in self._raw:
+            self._parsed_data[key] = self._parse_section(*self._raw.pop(key))
+        return self._parsed_data[key]
+
+    def __setitem__(self, key, val):
+        self._raw.pop(key, None)
+        self._formatted.pop(key, None)
+        self._items.pop(key, None)
+        super().__setitem__(key, val)
+
+    def __contains__(self, key):
+        # avoid parsing the section via `Mapping.__contains__`
+        return key in self._parsed_data
+
+    def copy(self):
+        """
+        Shallow copy that can be edited by assigning new values to sections,
+        without affecting the original. The section values themselves are
+        shared, and should not be modified in place.
+        """
+        new = copy.copy(self)
+        new._parsed_data = dict(self._parsed_data)
+        new._raw = dict(self._raw)
+        new._formatted = {}
+        new._items = {}
+        return new
+
+    def formatted(self, section):
+        """
+        Formatted lines for `section`. These are cached, since the same section
+        of a source docstring is often spliced into many others.
+        """
+        lines = self._formatted.get(section)
+        if lines is None:
+            lines = self._formatted[section] = tuple(FORMATTERS[section](self))
+        return lines
+
+    def get_items(self, section):
+        """
+        Mapping from name to item (eg. `Parameter`) for the listed `section`.
+        The mapping for each section is built on first access, and should be
+        treated as read-only.
+        """
+        items = self._items.get(section)
+        if items is None:
+            # reversed, so the first of any duplicate names wins
+            items = self._items[section] = {item.name: item
+                                            for item in reversed(self[section])}
+        return items
+
+    def get_item(self, section, name):
+        """
+        Get item (eg. `Parameter`) named `name` from the listed `section`, or
+        `None` if it does not exist.
+        """
+        return self.get_items(section).get(name)
@@ -0,0 +1,44 @@
+"""
+Names of numpydoc docstring sections.
+"""
+
+# std
+import sys
+
+
+# All sections in the order in which numpydoc renders them. The names are
+# interned, so that comparisons with the (interned) section names of parsed
+# directives reduce to identity checks.
+SECTIONS = tuple(map(sys.intern, ('Signature',
+                                  'Summary',
+                                  'Extended Summary',
+                                  'Parameters',
+                                  'Attributes',
+                                  'Methods',
+                                  'Returns',
+                                  'Yields',
+                                  'Receives',
+                                  'Other Parameters',
+                                  'Raises',
+                                  'Warns',
+                                  'Warnings',
+                                  'See Also',
+                                  'Notes',
+                                  'References',
+                                  'Examples',
+                                  'index')))
+# Sets for fast membership tests
+VALID_SECTIONS = frozenset(SECTIONS)
+LISTED_SECTIONS = frozenset(map(sys.intern, ('Parameters',
+                                             'Returns',
+                                             'Yields',
+                                             'Receives',
+                                             'Other Parameters',
+                                             'Raises',
+                                             'Warns',
+                                             'Attributes',
+                                             'Methods')))
+STRING_SECTIONS = frozenset(map(sys.intern, ('Warnings',
+                                             'Notes',
+                                             'References',
+                                             'Examples')))
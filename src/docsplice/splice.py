@@ -4,13 +4,19 @@ Docstring splicing and fstring-like substitutions.
 
 # std
 import re
-import inspect
+import sys
 import logging
 from warnings import warn
+from operator import itemgetter
+from contextlib import suppress
+from functools import lru_cache
 from collections import defaultdict
+from weakref import WeakKeyDictionary
 
-# third-party
-from numpydoc.docscrape import NumpyDocString
+# relative
+# pylint: disable-next=unused-import  # SECTIONS, STRING_SECTIONS re-exported
+from .sections import (SECTIONS, VALID_SECTIONS, LISTED_SECTIONS,
+                       STRING_SECTIONS)
 
 # module level logger
 logging.basicConfig()
@@ -19,73 +25,186 @@ logger.setLevel(logging.INFO)
 
 
 TAB = ' ' * 4
-LISTED_SECTIONS = ('Parameters',
-                   'Returns',
-                   'Yields',
-                   'Receives',
-                   'Other Parameters',
-                   'Raises',
-                   'Warns',
-                   'Attributes',
-                   'Methods')
-STRING_SECTIONS = ('Warnings',
-                   'Notes',
-                   'References',
-                   'Examples')
-FORMATTERS = {
-    **{sec:                     NumpyDocString._str_param_list
-       for sec in LISTED_SECTIONS},
-    **{sec:                     NumpyDocString._str_section
-       for sec in STRING_SECTIONS},
-    **{'Signature':             NumpyDocString._str_signature,
-        'Summary':              NumpyDocString._str_summary,
-        'Extended Summary':     NumpyDocString._str_extended_summary,
-        'See Also':             NumpyDocString._str_see_also,
-        'index':                NumpyDocString._str_index}
-}
-
-# {name: getattr(NumpyDocString, f'_str_{name}'.lower().replace(' ', '_'))
-#  for name in ('Signature',
-#               'Summary',
-#               'Extended Summary',
-#               'See Also',
-#               'index')
-#  }
+_MISSING = object()  # sentinel for missing attributes
+# code object flags for functions taking *args, **kws (see `inspect`)
+CO_VARARGS = 0x04
+CO_VARKEYWORDS = 0x08
 
 # ---------------------------------------------------------------------------- #
 # cache
 
 
-class DocStringCache(defaultdict):
-    """Cache for parsed docs"""
+@lru_cache(maxsize=512)
+def _parse_docstring(docstring):
+    # lazy import: numpydoc is only needed once we start splicing
+    from .docscrape import LazyDocString
 
-    def __init__(self, *args, **kws):
-        super().__init__(NumpyDocString, *args, **kws)
+    return LazyDocString(docstring)
+
+
+# Fast path for repeated lookups on the same object: skips hashing the
+# docstring. Maps object -> (docstring, parsed)
+_parsed_by_object = WeakKeyDictionary()
+
+
+def parse_doc(obj):
+    """
+    Parse the docstring of `obj`, or `obj` itself if it is a string. Results
+    are cached on the docstring text, so each source docstring is parsed only
+    once, no matter how many times (or from how many objects) it is spliced
+    from. The parsed objects are shared, and should therefore be treated as
+    read-only.
+    """
+    if isinstance(obj, str):
+        return _parse_docstring(obj)
+
+    docstring = obj.__doc__ or ''
+    try:
+        cached, parsed = _parsed_by_object[obj]
+    except (KeyError, TypeError):
+        # TypeError: obj not weak-referenceable
+        pass
+    else:
+        # the docstring may have been altered (eg. by splicing) since
+        if cached is docstring:
+            return parsed
+
+    parsed = _parse_docstring(docstring)
+    with suppress(TypeError):
+        _parsed_by_object[obj] = (docstring, parsed)
+    return parsed
+
+
+# Memoized substitutions and insertions for each source object. These map
+# object -> (docstring, {directive: result})
+_subs_by_object = WeakKeyDictionary()
+_inserts_by_object = WeakKeyDictionary()
+
+
+def _get_memo(cache, obj):
+    # Results memoized for `obj`, discarded if its docstring has changed since.
+    # Objects that are not weak-referenceable get a new memo on every call.
+    docstring = obj.__doc__
+    with suppress(KeyError, TypeError):
+        cached, memo = cache[obj]
+        if cached is docstring:
+            return memo
+
+    memo = {}
+    with suppress(TypeError):
+        cache[obj] = (docstring, memo)
+    return memo
+
+
+class DocStringCache(dict):
+    """
+    Cache for parsed docs. Deprecated in favour of `parse_doc`.
+    """
 
     def __missing__(self, func):
-        # pylint: disable=not-callable
-        new = self[func] = self.default_factory(func.__doc__)
-        return new
+        warn('`DocStringCache` is deprecated, use `parse_doc` instead.',
+             DeprecationWarning)
+        return parse_doc(func)
 
 
-# Module scoped cache
+# Module scoped cache (deprecated)
 docStringCache = DocStringCache()
 
 # ---------------------------------------------------------------------------- #
 # helpers
 
 
+@lru_cache(32)
+def _sep(indent):
+    # indents come from a small set of values, so separators are reused
+    return f'\n{indent}'
+
+
 def indented(lines, indent=TAB):
-    return f'\n{indent}'.join(lines).rstrip()
+    return _sep(indent).join(lines).rstrip()
 
 
 def format_param(name, kind, descr, indent=TAB):
-    return indented([' : '.join((name, kind))] + descr, indent)
+    # untyped parameters are written without the separator, as numpydoc does
+    header = f'{name} : {kind}' if kind else name
+    return _sep(indent).join((header, *descr)).rstrip()
+
+
+def get_source(obj):
+    # parameters for classes are documented in the `__init__` method
+    return obj.__init__ if isinstance(obj, type) else obj
+
+
+def get_defaults(func):
+    # Read the parameter defaults for each source function directly from the
+    # function and its code object. Building the signature is much slower, so
+    # only do that for callables that are not plain python functions.
+    wrapped = getattr(func, '__wrapped__', _MISSING)
+    while wrapped is not _MISSING:
+        func = wrapped
+        wrapped = getattr(func, '__wrapped__', _MISSING)
+
+    code = getattr(func, '__code__', None)
+    if code is None:
+        import inspect
+
+        return {name: par.default
+                for name, par in inspect.signature(func).parameters.items()
+                if par.default is not par.empty}
+
+    defaults = func.__defaults__ or ()
+    names = code.co_varnames[code.co_argcount - len(defaults):code.co_argcount]
+    return {**dict(zip(names, defaults)), **(func.__kwdefaults__ or {})}
+
+
+def get_arg_index(func):
+    # Map parameter names of `func` to their position in `co_varnames`. Unlike
+    # `co_varnames` itself, this excludes the names of local variables.
+    # Returns None for callables without a code object.
+    code = getattr(func, '__code__', None)
+    if code is None:
+        return None
+
+    return _get_arg_index(code)
+
+
+@lru_cache(maxsize=1024)
+def _get_arg_index(code):
+    # cached on the code object, so as not to keep the function alive
+    flags = code.co_flags
+    n = (code.co_argcount + code.co_kwonlyargcount +
+         bool(flags & CO_VARARGS) + bool(flags & CO_VARKEYWORDS))
+    return {name: i for i, name in enumerate(code.co_varnames[:n])}
 
 
 def get_param_dict(doc):
     return {p.name: p for p in doc['Parameters']}
 
+
+@lru_cache()
+def _get_sub_regex(keys):
+    # Longest keys first so that keys which are substrings of others don't
+    # preempt the longer match
+    keys = sorted(keys, key=len, reverse=True)
+    return re.compile('|'.join(map(re.escape, keys)))
+
+
+def sub(string, mapping):
+    """
+    Substitute all occurrences of the keys in `mapping` with their values in a
+    single pass over `string`.
+    """
+    keys = frozenset(filter(None, mapping))
+    if not keys:
+        return string
+
+    if len(keys) == 1:
+        # a single plain replacement is cheaper than running the regex engine
+        key, = keys
+        return string.replace(key, mapping[key])
+
+    return _get_sub_regex(keys).sub(lambda match: mapping[match[0]], string)
+
 # def parse_examples # TODO
 
 
@@ -108,20 +227,33 @@ class Directive:
     `NumpyDocString` of the `from_func`
     """
 
-    regex = re.compile('''(?xm)
-            ^(?P<indent>[\t ]*)''' r'''
+    pattern = r'''
             (?P<directive>
                 \{
                     (?i:(?P<section>[a-z]+))
-                    (\[(?P<key>\w+)\])?
-                    (\.(?P<attr>\w+))?
-                    (\s+as\s+(?P<rename>\w+))?
-                    (\s*=\s*(?P<default>[^}]+))?
+                    (?:\[(?P<key>\w+)\])?
+                    (?:\.(?P<attr>\w+))?
+                    (?:\s+as\s+(?P<rename>\w+))?
+                    (?:\s*=\s*(?P<default>[^}\n]+))?
                 \}
             )
-        ''')
+        '''
+    # NOTE: The pattern is not anchored to the start of the line. Instead,
+    # `scan` only tries to match it at the start of lines containing an opening
+    # brace, so the engine never has to scan through bulk prose.
+    regex = re.compile(r'(?x)(?P<indent>[\t ]*)' + pattern)
+    # Directives given as mapping keys to `splice` have no indentation, so
+    # `parse` uses the bare pattern
+    parse_regex = re.compile('(?x)' + pattern)
+
+    # bound methods of the compiled patterns, to skip attribute lookups when
+    # scanning docstrings for directives
+    _match = regex.match
+    _parse_fullmatch = parse_regex.fullmatch
 
     # Attributes
+    __slots__ = ('directive', 'indent', 'section', 'key', 'attr', 'rename',
+                 'default')
     directive: str
     indent: str
     section: str
@@ -132,10 +264,17 @@ class Directive:
 
     @classmethod
     def parse(cls, string):
-        if (string[0] + string[-1]) != '{}':
-            string = string.join('{}')
+        # NOTE: slicing (rather than indexing) handles empty strings
+        if not (string[:1] == '{' and string[-1:] == '}'):
+            string = f'{{{string}}}'
+
+        name = string[1:-1]
+        if name.isalpha():
+            # plain section directive, eg. '{Summary}'. No need for the regex
+            return cls(string, section=name)
 
-        match = cls.regex.match(string)
+        # fullmatch, so trailing text is rejected rather than silently ignored
+        match = cls._parse_fullmatch(string)
         if match is None:
             raise ValueError(f'Directive {string!r} could not be parsed!')
 
@@ -143,15 +282,53 @@ class Directive:
 
     @classmethod
     def iter(cls, docstring):
-        for match in cls.regex.finditer(docstring):
-            yield cls(**match.groupdict())
+        for _, directive in cls.findall(docstring):
+            yield directive
 
-    def __init__(self, **parts):
-        self.__dict__.update(**parts)
-        section, key, attr = self.section, self.key, self.attr
-        self.section = section.title()
-        if self.section not in NumpyDocString.sections:
-            raise ValueError(f'{self.section} is not a valid section name.')
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def findall(cls, docstring):
+        """
+        Find all directives in `docstring`. Results are cached, since the same
+        docstring may be processed many times.
+
+        Returns
+        -------
+        tuple of ((int, int), Directive)
+            The span of each directive in the docstring, and the directive.
+        """
+        return tuple((match.span('directive'), cls(**match.groupdict()))
+                     for match in cls.scan(docstring))
+
+    @classmethod
+    def scan(cls, docstring):
+        """Yield the regex match for each directive in `docstring`."""
+        # Directives are always preceded by an opening brace, so only try to
+        # match the pattern at the start of lines that contain one. This avoids
+        # running the regex over long stretches of prose.
+        find, rfind = docstring.find, docstring.rfind
+        pos = 0
+        while (i := find('{', pos)) != -1:
+            # rewind to start of line so we capture the indent
+            match = cls._match(docstring, rfind('\n', 0, i) + 1)
+            if match and match.start('directive') == i:
+                yield match
+                pos = match.end()
+            else:
+                pos = i + 1
+
+    def __init__(self, directive, indent='', section='', key=None, attr=None,
+                 rename=None, default=None):
+        self.directive = directive
+        self.indent = indent
+        self.section = section = sys.intern(section.title())
+        self.key = key
+        self.attr = attr
+        self.rename = rename
+        self.default = default
+
+        if section not in VALID_SECTIONS:
+            raise ValueError(f'{section} is not a valid section name.')
 
         if key and (section not in LISTED_SECTIONS):
             warn(
@@ -165,8 +342,17 @@ class Directive:
     def __str__(self):
         return self.directive
 
+    # Directives are equal (and hash the same) if they were parsed from the
+    # same text. This allows caching their substitutions
+    def __eq__(self, other):
+        return (isinstance(other, Directive) and
+                (self.indent, self.directive) == (other.indent, other.directive))
+
+    def __hash__(self):
+        return hash((self.indent, self.directive))
+
     def __iter__(self):
-        yield from self.parts
+        return iter(self.parts)
 
     @property
     def parts(self):
@@ -174,81 +360,141 @@ class Directive:
                 self.default)
 
     def get_sub(self, func):
+        # Substitutions are memoized on the directive, the source function and
+        # its current docstring
+        return _get_sub(self, func)
+
+    def resolve(self, func):
         # func arg only needed if we plan to update the default in the parameter
         # description, so we can look up the old default.
-        directive = self.directive
-        indent, section, key, attr, rename, default = self
-        parsed_doc = docStringCache[func]
+        parsed_doc = parse_doc(func)
+        section = self.section
         if section not in parsed_doc:
             warn(f'Invalid docstring section {section!r}')
-            return directive
-
-        part = parsed_doc[section]
-        takes_param = (section in LISTED_SECTIONS + STRING_SECTIONS)
-        args = (parsed_doc, *(section, )[:takes_param])
-
-        if not key:
-            formatter = FORMATTERS[section]
-            return indented(formatter(*args), indent)
-
-        has_items = (section in LISTED_SECTIONS)
-        if not has_items:
-            warn(f'{section!r} section has no items. Could not lookup '
-                 f'item {key!r}.')
-            return directive
-
-        # check if item (parameter) available
-        names = next(zip(*part))
-        if key not in names:
-            warn(f'Could not find {key!r} in section {section!r}')
-            return directive
-
-        # get item from list of (Parameters/.../)
-        i = names.index(key)
-        item = part[i]  # parameter
-        if not attr:
-            if default:
-                params = inspect.signature(func).parameters
-                par = params[key]
-                if par.default is par.empty:
-                    warn(
-                        f'Not replacing default value for {section}[{key}]: '
-                        f'Function parameter {key!r} has no default value.'
-                    )
-                else:
-                    # replace text for old default with new val passed by user
-                    old_default = str(par.default)
-                    for i, line in enumerate(item.desc):
-                        item.desc[i] = line.replace(old_default, default)
-
-            return format_param(rename or item.name,
-                                item.type,
-                                item.desc,
-                                TAB + indent)
-
-        if hasattr(item, attr):
-            # get the attribute (decr)
-            return indented(getattr(item, attr), indent)
-
-        warn(f'{section}[{key}] has no attribute {attr!r}.')
-        return directive
-
-
-def get_subs(docstring, from_func):
-    # if from_func is None, we are spliceing from multiple sources. This
-    # will be handeled in the `insert` method
-    subs = {}
-    if from_func:
-        # Find directives in the docstring of the decorated function
-        # and, substitute the replacement texts
-        for directive in Directive.iter(docstring):
-            try:
-                subs[str(directive)] = \
-                    directive.get_sub(from_func)
-            except Exception as err:
-                raise type(err)(f'Invalid docsplice directive in {from_func}:'
-                                f'\n{err}') from None
-    return subs
+            return self.directive
+
+        handler = self._handlers[bool(self.key), bool(self.attr),
+                                 section in LISTED_SECTIONS]
+        return handler(self, func, parsed_doc)
+
+    def _sub_section(self, func, parsed_doc):
+        return indented(parsed_doc.formatted(self.section), self.indent)
+
+    def _sub_unlisted(self, func, parsed_doc):
+        warn(f'{self.section!r} section has no items. Could not lookup '
+             f'item {self.key!r}.')
+        return self.directive
+
+    def _get_item(self, parsed_doc):
+        # get item from list of (Parameters/.../), if available
+        item = parsed_doc.get_item(self.section, self.key)
+        if item is None:
+            warn(f'Could not find {self.key!r} in section {self.section!r}')
+        return item
+
+    def _sub_item(self, func, parsed_doc):
+        item = self._get_item(parsed_doc)
+        if item is None:
+            return self.directive
+
+        section, key, rename, default = \
+            self.section, self.key, self.rename, self.default
+        desc = item.desc
+        if default:
+            defaults = get_defaults(func)
+            if key not in defaults:
+                warn(
+                    f'Not replacing default value for {section}[{key}]: '
+                    f'Function parameter {key!r} has no default value.'
+                )
+            else:
+                # replace text for old default with new val passed by user.
+                # NOTE: the parsed doc is cached, so don't edit it in place
+                old_default = str(defaults[key])
+                desc = [line.replace(old_default, default) for line in desc]
+
+        return format_param(rename or item.name,
+                            item.type,
+                            desc,
+                            TAB + self.indent)
+
+    def _sub_attr(self, func, parsed_doc):
+        item = self._get_item(parsed_doc)
+        if item is None:
+            return self.directive
+
+        # get the attribute (desc)
+        value = getattr(item, self.attr, _MISSING)
+        if value is not _MISSING:
+            return indented(value, self.indent)
+
+        warn(f'{self.section}[{self.key}] has no attribute {self.attr!r}.')
+        return self.directive
+
+    # Replacement text is generated by one of the methods above, depending on
+    # the form of the directive: (has key, has attribute, is listed section)
+    _handlers = {
+        (False, False, False):  _sub_section,
+        (False, False, True):   _sub_section,
+        (False, True, False):   _sub_section,
+        (False, True, True):    _sub_section,
+        (True, False, False):   _sub_unlisted,
+        (True, True, False):    _sub_unlisted,
+        (True, False, True):    _sub_item,
+        (True, True, True):     _sub_attr
+    }
+
+
+def _get_sub(directive, func):
+    memo = _get_memo(_subs_by_object, func)
+    new = memo.get(directive)
+    if new is None:
+        new = memo[directive] = directive.resolve(func)
+    return new
+
+
+def _get_insert(directive, func):
+    # Lines to insert for `directive`. For listed sections, the incoming
+    # item(s) are parsed, so they need only be merged into the destination
+    memo = _get_memo(_inserts_by_object, func)
+    new = memo.get(directive)
+    if new is None:
+        new = _get_sub(directive, func).splitlines()
+        if directive.section in LISTED_SECTIONS:
+            new = parse_doc(func)._parse_param_list(new)
+        new = memo[directive] = tuple(new)
+    return new
+
+
+def sub_directives(docstring, from_func):
+    """
+    Resolve the directives in `docstring` against the docstring of `from_func`
+    and substitute the replacement texts. Directives are resolved and replaced
+    in a single scan over `docstring`.
+
+    Returns
+    -------
+    str
+        The new docstring.
+    int
+        The number of directives found.
+    """
+    if '{' not in docstring:
+        # no directives. Skip hashing the docstring for the cache lookup
+        return docstring, 0
+
+    parts = []
+    pos = 0
+    try:
+        for (start, end), directive in Directive.findall(docstring):
+            parts.extend((docstring[pos:start], directive.get_sub(from_func)))
+            pos = end
+    except Exception as err:
+        raise type(err)(f'Invalid docsplice directive in {from_func}:'
+                        f'\n{err}') from None
+
+    parts.append(docstring[pos:])
+    return ''.join(parts), len(parts) // 2
 
 
 # ---------------------------------------------------------------------------- #
@@ -276,6 +522,9 @@ class splice:
             sections from various other sources, by default None.
         replace : dict, optional
             Verbatim substitution mapping str -> str, by default None.
+        omit : str or tuple of str, optional
+            Directives for sections, or items of listed sections, to remove
+            from the new docstring, by default ().
         onfail : callable, optional
             What to do when the decorator throws an exception. Since the
             function of this decorator is not mission critical, it's better to
@@ -328,8 +577,11 @@ class splice:
             else:
                 sections = (maybe_dict, *sections)
 
-        # sections passed as arguments are inserted
-        insert.update({s.capitalize(): from_func for s in sections})
+        # Sections passed as arguments are inserted. Normalize the names here
+        # once, the same way `Directive` does. Copy the mapping so we don't
+        # alter the one passed in by the user.
+        insert = {**insert,
+                  **dict.fromkeys(map(str.title, sections), from_func)}
 
         self.from_func = from_func
         self.origin = None      # parsed docstring of decorated function if any
@@ -338,6 +590,9 @@ class splice:
         self.directives = insert
         self.exception_hook = onfail
 
+        # parsed directives, populated on first use by `_parse_directives`
+        self._parsed_directives = self._parsed_omit = None
+
     def __call__(self, func):
         # Handle exceptions here
         # pylint: disable=broad-except
@@ -353,12 +608,16 @@ class splice:
         This is a signature preserving decorator that only alters the `__doc__`
         attribute of the object.
         """
-        # avoid circular import :|
-        from recipes.string import sub
-
         # docstring of decorated function. The one to be adapted.
         self.origin = docstring = func.__doc__
 
+        if not (self.from_func or self.directives or self.to_sub or
+                self.to_omit):
+            # nothing to do
+            warn(f'{self.__class__.__name__} did not alter docstring for '
+                 f'{func}.')
+            return func
+
         # make substitutions. verbatim substitutions happen
         if docstring is None:
             # if decorated function has no docstring carbon copy the
@@ -373,15 +632,15 @@ class splice:
             # decorated function has a docstring. Look for directives and
             # substitute them
             if callable(self.from_func):
-                # new = self.sub(docstring)
-                self.to_sub.update(get_subs(docstring, self.from_func))
-                if self.to_sub:
-                    new = sub(docstring, self.to_sub)
-                    # TODO: do things in the order in which arguments were passed
-                    if new == docstring:
-                        warn('Docstring for function {func} identical '
-                             'after substitution')
-                    docstring = new
+                # directives are resolved and substituted in one pass, followed
+                # by the verbatim substitutions
+                new, found = sub_directives(docstring, self.from_func)
+                new = sub(new, self.to_sub)
+                # TODO: do things in the order in which arguments were passed
+                if (found or self.to_sub) and new == docstring:
+                    warn(f'Docstring for function {func} identical after '
+                         'substitution')
+                docstring = new
                 # elif 'Parameters' in self.directives:
                 #     # no directives found in docstring. Fill parameters automatically
                 #     odoc = NumpyDocString(self.origin)
@@ -390,95 +649,148 @@ class splice:
             else:
                 'multi-source without explicit mapping. might be ambiguous'
 
-        # parse the update docstring
-        doc = NumpyDocString(docstring)
+        if not (self.directives or self.to_omit):
+            # No structural changes to the docstring: substitutions were done
+            # in place on the text above, so we can skip the parse / serialize
+            # round trip
+            if docstring == self.origin:
+                warn(f'{self.__class__.__name__} did not alter docstring for '
+                     f'{func}.')
+            else:
+                func.__doc__ = docstring
+            return func
 
-        # Expand bare 'Parameters' directive to include parameters that are
-        # missing in the destination docstring, but are present in the source
-        # docstring. Below this will automatically populate the destination
-        # parameter info from that available from parent docstring without
-        # overwriting anything.
-        if 'Parameters' in self.directives:
-            from_func = self.directives['Parameters']
-            parsed_doc = docStringCache[from_func]
-            source = get_param_dict(parsed_doc)
-            dest = get_param_dict(doc)
-            for pname in func.__code__.co_varnames:
-                if pname not in dest and pname in source:
-                    self.directives[f'Parameters[{pname}]'] = from_func
-
-            # print(self.directives)
-
-        # parse directives and insert new text
-        doc = self.insert(func, doc)
+        # parse directives (once) for this decorator
+        self._parse_directives()
+
+        # Parse the updated docstring. If it was left unchanged by the
+        # substitutions above, it may already be in the cache. Take a copy,
+        # since the parsed doc is edited below.
+        doc = parse_doc(docstring).copy()
+
+        # insert new text
+        doc = self.insert(func, doc, *self._expand_params(func, doc))
 
         # remove omitted sections / parameters
-        self.get_remove(self.from_func)
+        doc = self.remove(doc)
 
         # write the new docstring
-        if (self.to_sub or self.directives):
-            # NOTE: the string computed be =low will not be indented as is the
-            # case with docstrings that are directly defined in the source at
-            # function / class definition.
-            func.__doc__ = str(doc)
-        else:
-            warn(
-                f'{self.__class__.__name__} did not alter docstring for {func}.'
-            )
+        # NOTE: the string computed below will not be indented as is the case
+        # with docstrings that are directly defined in the source at function /
+        # class definition.
+        func.__doc__ = str(doc)
 
         return func
 
-    # def sub(self, docstring):
-    #     # avoid circular import :|
-    #     from recipes.string import sub
-
-    #     self.to_sub.update(get_subs(docstring, self.from_func))
-    #     return sub(docstring, self.to_sub)
-
-    def insert(self, func, doc):
+    def _expand_params(self, func, doc):
+        # Expand bare 'Parameters' directive to include parameters that are
+        # missing in the destination docstring, but are present in the source
+        # docstring. `insert` will then populate the destination parameter info
+        # from that available in the source docstring without overwriting
+        # anything. Also returns the argument positions of `func` if they were
+        # needed here, so they are computed only once.
+        if 'Parameters' not in self.directives:
+            return (), None
+
+        position = get_arg_index(get_source(func))
+        from_func = self.directives['Parameters']
+        source = parse_doc(get_source(from_func)).get_items('Parameters')
+        dest = get_param_dict(doc)
+        expanded = [(Directive.parse(f'Parameters[{pname}]'), from_func)
+                    for pname in (position or ())
+                    if pname not in dest and pname in source]
+        return expanded, position
+
+    def _parse_directives(self):
+        # Directives are parsed on first use rather than in `__init__`, so that
+        # invalid ones are handled by `exception_hook` like any other error
+        if self._parsed_directives is not None:
+            return
+
+        directives = [(Directive.parse(directive), ifunc)
+                      for directive, ifunc in self.directives.items()]
+        self._parsed_omit = [Directive.parse(directive)
+                             for directive in self.to_omit]
+        self._parsed_directives = directives
+
+    def insert(self, func, doc, expanded=(), position=None):
+
+        # new items for listed sections are collected and added to the
+        # destination docstring in one go per section below
+        listed = defaultdict(list)
+        for directive, new in self._resolve_inserts((*self._parsed_directives,
+                                                     *expanded)):
+            section = directive.section
+            if section in LISTED_SECTIONS:
+                listed[section].append((directive.rename or directive.key, new))
+            else:
+                # warn if we are about to overwrite things. This is probably
+                # unintentional
+                if any(doc[section]):
+                    warn(f'You are overwriting the {section} section.')
+                doc[section] = list(new)
+
+        for section, new in listed.items():
+            if section == 'Parameters':
+                if position is None:
+                    position = get_arg_index(get_source(func))
+                doc[section] = self._insert_params(func, doc[section], new,
+                                                   position)
+            else:
+                # NOTE: don't extend in place: lists may be shared with cache
+                doc[section] = [*doc[section],
+                                *(item for _, items in new for item in items)]
 
-        for directive, ifunc in self.directives.items():
-            if isinstance(ifunc, type):
-                ifunc = ifunc.__init__
+        return doc
 
-            # get parsed docstring (NumpyDocString) from cache (or create it
-            # if needed)
-            if ifunc.__doc__ is None:
+    @staticmethod
+    def _resolve_inserts(directives):
+        # Resolve each directive against the current docstring of its source
+        # function. Results are memoized by `_get_insert`
+        inserts = []
+        for directive, ifunc in directives:
+            ifunc = get_source(ifunc)
+            if not ifunc.__doc__:
                 warn(f'No docstring available for {ifunc}. Skipping.')
                 continue
 
-            directive = Directive.parse(directive)
-            _, section, key, _, rename, _ = directive
-            new = directive.get_sub(ifunc)
-            if section in LISTED_SECTIONS:
-                # read the incoming parameter(s) and edit the parameter list of
-                # the decorated function docstring
-                new = doc._parse_param_list(new)
-                if section == 'Parameters':
-                    # find position of new parameter and insert it in the list
-                    par_names = func.__code__.co_varnames
-                    part = doc[section]
-                    # if rename or key not specified, populate automatically for
-                    # parameters that are missing in the destination docstring
-                    if not rename and not key:
-                        continue
-
-                    i = par_names.index(rename or key) - isinstance(func, type)
-                    doc[section] = part[:i] + new + part[i:]
-                else:
-                    doc[section].extend(new)
+            if (directive.section == 'Parameters'
+                    and not (directive.rename or directive.key)):
+                # bare 'Parameters' directive is expanded in `splice` to
+                # populate parameters that are missing in the destination
+                # docstring
+                continue
+
+            inserts.append((directive,
+                            _get_insert(directive, ifunc)))
+        return inserts
+
+    @staticmethod
+    def _insert_params(func, part, new, position):
+        # Merge new parameters into the existing list in a single pass. Each
+        # new parameter is placed at the position of its name in the function
+        # signature, given by `position`.
+        offset = isinstance(func, type)  # skip `self` for classes
+        new = sorted(((position[name] - offset, items) for name, items in new),
+                     key=itemgetter(0))
+
+        params = []
+        j = 0
+        for i, items in new:
+            take = max(i - len(params), 0)
+            params.extend(part[j:j + take])
+            j += take
+            params.extend(items)
+        params.extend(part[j:])
+        return params
+
+    def remove(self, doc):
+        for directive in self._parsed_omit:
+            section, key = directive.section, directive.key
+            if key and section in LISTED_SECTIONS:
+                # NOTE: don't filter in place: lists may be shared with cache
+                doc[section] = [item for item in doc[section]
+                                if item.name != key]
             else:
-                # warn if we are about to overwrite things. This is probably
-                # unintentional
-                for line in doc[section]:
-                    if line:
-                        warn(f'You are overwriting the {section} section.')
-                        break
-                doc[section] = new.splitlines()
+                doc[section] = type(doc[section])()
         return doc
-
-    def get_remove(self, from_func):
-        for directive in self.to_omit:
-            directive = Directive.parse(directive)
-            to_omit = directive.get_sub(from_func)
-            self.to_sub[to_omit] = ''
@@ -1,6 +1,8 @@
 
 # std
+import gc
 import re
+import weakref
 import textwrap as txw
 from pathlib import Path
 
@@ -9,6 +11,7 @@ import pytest
 
 # local
 import docsplice as doc
+from docsplice.splice import Directive, sub
 
 
 # ---------------------------------------------------------------------------- #
@@ -190,3 +193,314 @@ def match(string, brackets, indexed=True, must_close=False):
 #
 # recipes.string.brackets
 # -----------------------
+
+
+# ---------------------------------------------------------------------------- #
+# Parsed source docstrings are cached and shared between decorations
+
+def source(a, n=0):
+    """
+    Parameters
+    ----------
+    a : int
+        The number.
+    n : int, optional
+        Another number. By default 0.
+    """
+
+
+def test_default_does_not_alter_source():
+
+    @doc.splice({'Parameters[n] = 3': source})
+    def first(n=3):
+        """Summary."""
+
+    @doc.splice({'Parameters[n] = 5': source})
+    def second(n=5):
+        """Summary."""
+
+    assert 'By default 3.' in first.__doc__
+    assert 'By default 5.' in second.__doc__
+    assert 'By default 0.' in source.__doc__
+
+
+# ---------------------------------------------------------------------------- #
+# Single pass substitution
+
+@pytest.mark.parametrize(
+    'string, mapping, expected',
+    [('{a} {ab}', {'{a}': 'x', '{ab}': 'y'}, 'x y'),
+     ('abc', {'a': 'b', 'b': 'c'}, 'bcc'),
+     ('abca', {'a': 'x'}, 'xbcx'),
+     ('abc', {}, 'abc')]
+)
+def test_sub(string, mapping, expected):
+    assert sub(string, mapping) == expected
+
+
+def test_substitution_only():
+
+    @doc.splice(source)
+    def summed(a, b):
+        """
+        Add two numbers.
+
+        Parameters
+        ----------
+        {Parameters[a]}
+        {Parameters[a] as b}
+        """
+
+    assert summed.__doc__ == """
+        Add two numbers.
+
+        Parameters
+        ----------
+        a : int
+            The number.
+        b : int
+            The number.
+        """
+
+
+def test_insert_parameters_in_signature_order():
+
+    @doc.splice({'Parameters[n] as c': source,
+                 'Parameters[a]': source})
+    def combined(a, b, c):
+        """
+        Summary.
+
+        Parameters
+        ----------
+        b : str
+            Some text.
+        """
+
+    params = [line.split(' : ')[0] for line in combined.__doc__.splitlines()
+              if ' : ' in line]
+    assert params == ['a', 'b', 'c']
+
+
+def test_item_attribute():
+
+    @doc.splice(source)
+    def described(a):
+        """
+        Summary.
+
+        Parameters
+        ----------
+        a : float
+            {Parameters[a].desc}
+        """
+
+    assert '    a : float\n            The number.\n' in described.__doc__
+
+
+def test_insert_parameters_skips_locals():
+
+    @doc.splice({'Parameters[a] as x': source})
+    def with_locals(y, x, *args, **kws):
+        """
+        Summary.
+
+        Parameters
+        ----------
+        y : int
+            Why.
+        """
+        z = x + y
+        return z
+
+    params = [line.split(' : ')[0]
+              for line in with_locals.__doc__.splitlines() if ' : ' in line]
+    assert params == ['y', 'x']
+
+
+def test_reused_decorator():
+
+    splicer = doc.splice(source, 'Parameters')
+
+    @splicer
+    def first(a, n):
+        """Summary."""
+
+    @splicer
+    def second(a):
+        """Summary."""
+
+    assert '\nn : ' in first.__doc__
+    assert '\nn : ' not in second.__doc__
+    assert list(splicer.directives) == ['Parameters']
+
+
+@pytest.mark.parametrize('string', ['Summary} trailing', '{Parameters[a]}.x'])
+def test_parse_rejects_trailing_text(string):
+    with pytest.raises(ValueError):
+        Directive.parse(string)
+
+
+def test_item_without_type():
+
+    def untyped(a):
+        """
+        Parameters
+        ----------
+        a
+            The number.
+        """
+
+    @doc.splice(untyped)
+    def target(a):
+        """
+        Parameters
+        ----------
+        {Parameters[a]}
+        """
+
+    assert '\n        a\n            The number.\n' in target.__doc__
+
+
+def test_omit():
+
+    @doc.splice(source, omit=('Parameters[n]', 'Notes'))
+    def trimmed(a):
+        """
+        Summary.
+
+        Parameters
+        ----------
+        a : int
+            The number.
+        {Parameters[n]}
+
+        Notes
+        -----
+        Nothing to see here.
+        """
+
+    assert '\na : int' in trimmed.__doc__
+    assert '\nn : ' not in trimmed.__doc__
+    assert 'Notes' not in trimmed.__doc__
+
+
+@pytest.mark.parametrize('kws', [{'insert': {'Bogus': source}},
+                                 {'omit': 'Bogus'}])
+def test_invalid_directive_onfail(kws):
+
+    errors = []
+
+    @doc.splice(source, onfail=errors.append, **kws)
+    def func(a):
+        """Summary."""
+
+    assert len(errors) == 1
+    assert isinstance(errors[0], ValueError)
+    assert func.__doc__ == 'Summary.'
+
+
+def test_invalid_source_onfail():
+
+    def receiver():
+        """
+        Receives
+        --------
+        x : int
+            The number.
+        """
+
+    errors = []
+    splicer = doc.splice(receiver, 'Receives', onfail=errors.append)
+
+    @splicer
+    def func():
+        """Summary."""
+
+    assert len(errors) == 1
+    assert isinstance(errors[0], ValueError)
+
+
+@pytest.mark.parametrize(
+    'sections, docstring',
+    [(('Notes', ), 'Summary.'),             # insert
+     ((), '\nSummary.\n\n{Notes}\n')]     # directive
+)
+def test_source_changed(sections, docstring):
+
+    def noted():
+        """
+        Notes
+        -----
+        Old note.
+        """
+
+    def target():
+        pass
+
+    splicer = doc.splice(noted, *sections)
+    target.__doc__ = docstring
+    first = splicer(target).__doc__
+
+    noted.__doc__ = noted.__doc__.replace('Old', 'New')
+    target.__doc__ = docstring
+    second = splicer(target).__doc__
+
+    assert 'Old note.' in first
+    assert 'New note.' in second
+
+
+class Callable:
+    """Callable doc."""
+
+    def __call__(self):
+        pass
+
+
+def noted():
+    """
+    Notes
+    -----
+    A note.
+    """
+
+
+@pytest.mark.parametrize('obj', [type('Class', (), {'__doc__': 'Class doc.'}),
+                                 Callable()])
+def test_splice_section_without_code(obj):
+    spliced = doc.splice(noted, 'Notes', onfail=pytest.fail)(obj)
+    assert 'A note.' in spliced.__doc__
+
+
+def test_source_not_kept_alive():
+
+    def temporary(a, n=0):
+        """
+        Parameters
+        ----------
+        a : int
+            The number.
+        n : int, optional
+            Another number. By default 0.
+
+        Notes
+        -----
+        A note.
+        """
+
+    @doc.splice(temporary, 'Notes', onfail=pytest.fail)
+    def func(a, n=1):
+        """
+        Summary.
+
+        Parameters
+        ----------
+        {Parameters[a]}
+        {Parameters[n]=1}
+        """
+
+    ref = weakref.ref(temporary)
+    del temporary
+    gc.collect()
+    assert ref() is None
+    assert 'A note.' in func.__doc__